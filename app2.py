@@ -1,73 +1,122 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import io
+import json
+import os
 
-# Custom CSS for navy blue and whitish theme with Poppins font
-st.markdown("""
-<style>
-    /* Import Poppins font from Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600&display=swap');
+@st.cache_data(show_spinner=False)
+def parse_vendor_map(s: str) -> dict:
+    # Parse the JSON mapping once per distinct input; keys become ints to match the numeric Vid column
+    return {int(k): v for k, v in json.loads(s).items()} if s.strip() else {}
+
+MAX_CHART_POINTS = 1500  # Plotly slows down noticeably past a few thousand points
+PIE_TOP_VENDORS = 15  # Remaining vendors are grouped into a single "Other" slice
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    # Largest-Triangle-Three-Buckets: pick n_out row positions that preserve the visual shape of (x, y)
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    x = x.astype('float64')
+    y = y.astype('float64')
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=int)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[hi:nxt_hi].mean(), y[hi:nxt_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+def daily_totals(dates: pd.Series, amounts: pd.Series) -> pd.Series:
+    # Sum amounts per calendar day with np.unique + np.bincount on datetime64[D] keys instead of a pandas groupby
+    days = dates.to_numpy().astype('datetime64[D]')
+    valid = ~np.isnat(days)
+    unique_days, inverse = np.unique(days[valid], return_inverse=True)
+    totals = np.bincount(inverse, weights=np.nan_to_num(amounts.to_numpy()[valid]), minlength=len(unique_days))
+    return pd.Series(totals, index=pd.DatetimeIndex(unique_days, name='Date_only'), name='Amount', dtype='float64')
+
+def channel_totals(channels: pd.Series, amounts: pd.Series) -> pd.DataFrame:
+    # Per-channel Amount sum and row count in one np.bincount pass over the categorical codes
+    codes = channels.cat.codes.to_numpy()
+    valid = codes >= 0
+    n_channels = len(channels.cat.categories)
+    n = np.bincount(codes[valid], minlength=n_channels)
+    amt = np.bincount(codes[valid], weights=np.nan_to_num(amounts.to_numpy()[valid]), minlength=n_channels)
+    return pd.DataFrame({'amt': amt, 'n': n}, index=channels.cat.categories)[n > 0]
+
+@st.cache_data(show_spinner=False)
+def load_css() -> str:
+    # Read the stylesheet from disk once per server process rather than on every rerun
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'style.css'), encoding='utf-8') as f:
+        return f.read()
+
+EXPECTED_COLUMNS = ['Date', 'Amount', 'Commission', 'Vat', 'Vid', 'Channel Type']
+NUMERIC_COLUMNS = ['Amount', 'Commission', 'Vat', 'Vid', 'Running Balance']
+DTYPES = {
+    'Date': 'string',
+    'Amount': 'float64',
+    'Commission': 'float64',
+    'Vat': 'float64',
+    'Vid': 'Int64',
+    'Running Balance': 'float64',
+    'Channel Type': 'category',
+    'Code': 'string',
+}
+
+@st.cache_data(show_spinner=False)
+def load_and_clean(file_bytes: bytes, name: str) -> pd.DataFrame | None:
+    # Read and clean one uploaded file; cached on its contents so filter reruns skip parsing
+    # Validate columns from the header alone before parsing the body (the first line is a title row)
+    header = pd.read_csv(io.BytesIO(file_bytes), sep='\t', header=1, nrows=0, engine='c')
+    if not all(col in header.columns for col in EXPECTED_COLUMNS):
+        return None
+    
+    # The pyarrow engine needs an integer header row rather than skiprows. Its ISO-8601 inference turns offset
+    # timestamps into UTC before the 'string' dtype is applied, so only naive timestamps may be inferred
+    read_kwargs = dict(sep='\t', header=1, date_format='%Y-%m-%d %H:%M:%S')
+    
+    def read(dtype: dict) -> pd.DataFrame:
+        try:
+            return pd.read_csv(io.BytesIO(file_bytes), dtype=dtype, engine='pyarrow', **read_kwargs)
+        except pd.errors.ParserError:
+            # Short rows (dropped trailing fields, footer lines): the C engine pads them with NaN where pyarrow refuses
+            return pd.read_csv(io.BytesIO(file_bytes), dtype=dtype, engine='c', **read_kwargs)
+    
+    try:
+        df = read(DTYPES)
+    except ValueError:
+        # Non-numeric cells: read numbers as text and coerce them to NaN in one vectorized pass
+        text_dtypes = {col: dtype for col, dtype in DTYPES.items() if col not in NUMERIC_COLUMNS}
+        df = read(text_dtypes)
+        present = [col for col in NUMERIC_COLUMNS if col in df.columns]
+        numeric = df[present].apply(pd.to_numeric, errors='coerce')
+        # Non-integral Vids can't be cast to Int64; treat them as missing like any other malformed value
+        numeric['Vid'] = numeric['Vid'].where(numeric['Vid'] % 1 == 0)
+        df[present] = numeric.astype({col: DTYPES[col] for col in present})
+    
+    # Data cleaning (numeric types are already applied by read_csv)
+    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+    if df['Date'].dt.tz is not None:
+        # Keep the exported wall-clock time so daily buckets follow the statement's local dates
+        df['Date'] = df['Date'].dt.tz_localize(None)
+    if 'Code' in df.columns:
+        df['Code'] = df['Code'].str.strip("'")
+    
+    # Add date_only for grouping
+    df['Date_only'] = df['Date'].dt.floor('D')
+    return df
 
-    /* Apply Poppins font and navy blue theme */
-    body {
-        font-family: 'Poppins', sans-serif;
-        background-color: #F5F7FA; /* Whitish background */
-        color: #1A2B5F; /* Navy blue text */
-    }
-    .stApp {
-        background-color: #F5F7FA;
-    }
-    h1, h2, h3, h4, h5, h6 {
-        color: #1A2B5F; /* Navy blue headers */
-        font-weight: 600;
-    }
-    .stMetric {
-        background-color: #FFFFFF; /* White background for metrics */
-        border: 1px solid #1A2B5F; /* Navy blue border */
-        border-radius: 8px;
-        padding: 10px;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    .stButton>button {
-        background-color: #1A2B5F; /* Navy blue buttons */
-        color: #FFFFFF; /* White text */
-        border-radius: 8px;
-        font-family: 'Poppins', sans-serif;
-        font-weight: 400;
-    }
-    .stButton>button:hover {
-        background-color: #2C3E7A; /* Lighter navy on hover */
-        color: #FFFFFF;
-    }
-    .sidebar .sidebar-content {
-        background-color: #1A2B5F; /* Navy blue sidebar */
-        color: #FFFFFF;
-    }
-    .sidebar .sidebar-content .stMultiSelect div, .sidebar .sidebar-content .stTextArea textarea {
-        background-color: #FFFFFF; /* White input fields */
-        color: #1A2B5F;
-        border-radius: 8px;
-    }
-    .stExpander {
-        background-color: #FFFFFF;
-        border: 1px solid #1A2B5F;
-        border-radius: 8px;
-    }
-    .stDataFrame {
-        background-color: #FFFFFF;
-        border-radius: 8px;
-    }
-    /* Customize Plotly charts */
-    .plotly-chart {
-        background-color: #FFFFFF;
-        border: 1px solid #1A2B5F;
-        border-radius: 8px;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for navy blue and whitish theme with Poppins font
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 # Page config
 st.set_page_config(page_title="Sales Analysis Dashboard", layout="wide", page_icon="📊")
@@ -83,40 +132,32 @@ if uploaded_files:
     try:
         # Load and concatenate multiple files
         dfs = []
-        expected_columns = ['Date', 'Amount', 'Commission', 'Vat', 'Vid', 'Channel Type']
         for file in uploaded_files:
-            df_temp = pd.read_csv(file, sep='\t', skiprows=1, header=0)
+            df_temp = load_and_clean(file.getvalue(), file.name)
             # Validate columns
-            if not all(col in df_temp.columns for col in expected_columns):
-                st.error(f"File {file.name} does not have the expected columns: {', '.join(expected_columns)}")
+            if df_temp is None:
+                st.error(f"File {file.name} does not have the expected columns: {', '.join(EXPECTED_COLUMNS)}")
                 st.stop()
             dfs.append(df_temp)
         
         # Combine all files into a single DataFrame
         if dfs:
-            df = pd.concat(dfs, ignore_index=True)
+            # Share one category set across files so concat keeps Channel Type categorical instead of falling back to object
+            channel_dtype = pd.CategoricalDtype(sorted(set().union(*(d['Channel Type'].cat.categories for d in dfs))))
+            df = pd.concat([d.astype({'Channel Type': channel_dtype}) for d in dfs], ignore_index=True)
         else:
             st.error("No valid data loaded from the uploaded files.")
             st.stop()
         
-        # Data cleaning
-        df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-        numeric_cols = ['Amount', 'Commission', 'Vat', 'Vid', 'Running Balance']
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-        if 'Code' in df.columns:
-            df['Code'] = df['Code'].astype(str).str.strip("'")
-        
-        # Add date_only for grouping
-        df['Date_only'] = df['Date'].dt.date
-        
         # Sidebar for filters
         st.sidebar.header("🔧 Filters & Mappings")
         
+        # Widgets in a form only commit their values on "Apply", so editing them doesn't rerun the analysis
+        filters_form = st.sidebar.form("filters")
+        
         # Channel Type filter (applies only to charts and report)
         channel_types = df['Channel Type'].dropna().unique().tolist()
-        selected_channels = st.sidebar.multiselect(
+        selected_channels = filters_form.multiselect(
             "Filter by Channel Type (Charts & Report Only)",
             options=channel_types,
             default=channel_types,
@@ -125,7 +166,7 @@ if uploaded_files:
         
         # Vid filter (applies to metrics, charts, and report)
         vids = sorted(df['Vid'].dropna().unique())
-        selected_vids = st.sidebar.multiselect(
+        selected_vids = filters_form.multiselect(
             "Filter by Vendor ID (Vid)",
             options=vids,
             default=vids,
@@ -133,43 +174,57 @@ if uploaded_files:
         )
         
         # Vendor Mapping input
-        mapping_input = st.sidebar.text_area(
+        mapping_input = filters_form.text_area(
             "Vendor ID Mapping (JSON format, e.g., {\"254499\": \"Vendlite\"})",
             value='{"254499": "Vendlite"}',
             height=100,
             help="Enter mappings as JSON. Example: {\"254499\": \"Vendlite\", \"254754\": \"VendorX\"}. Unmapped Vids will show numeric."
         )
+        filters_form.form_submit_button("Apply Filters")
         
-        # Apply Vendor ID filter for metrics
-        metrics_df = df[df['Vid'].isin(selected_vids) if selected_vids else True].copy()
-        
-        # Apply both filters for charts and report
-        filtered_df = metrics_df[metrics_df['Channel Type'].isin(selected_channels)].copy()
+        # Sets of the current selections, compared against all channels for the no-op check below
+        sel_vids = frozenset(selected_vids)
+        sel_ch = frozenset(selected_channels)
         
         # Parse vendor mapping
         try:
-            vendor_map = eval(mapping_input) if mapping_input.strip() else {}
-            metrics_df['Vendor Name'] = metrics_df['Vid'].map(vendor_map).fillna(metrics_df['Vid'].astype(str))
-            filtered_df['Vendor Name'] = filtered_df['Vid'].map(vendor_map).fillna(filtered_df['Vid'].astype(str))
+            vendor_map = parse_vendor_map(mapping_input)
         except Exception as e:
             st.sidebar.error(f"Invalid mapping format: {e}. Using default mapping (254499: Vendlite).")
             vendor_map = {254499: 'Vendlite'}
-            metrics_df['Vendor Name'] = metrics_df['Vid'].map(vendor_map).fillna(metrics_df['Vid'].astype(str))
-            filtered_df['Vendor Name'] = filtered_df['Vid'].map(vendor_map).fillna(filtered_df['Vid'].astype(str))
         
-        # C2B filtered for transaction counts (metrics and charts)
-        c2b_metrics = metrics_df[metrics_df['Channel Type'] == 'C2B'].copy()
-        c2b_filtered = filtered_df[filtered_df['Channel Type'] == 'C2B'].copy()
+        # Apply Vendor ID filter for metrics (an empty selection keeps every vendor)
+        metrics_df = df.loc[df['Vid'].isin(sel_vids)] if sel_vids else df
+        
+        # Map vendor names once, on the Vid-filtered rows only; filtered_df inherits the column
+        vendor_names = metrics_df['Vid'].map(vendor_map).astype('string').fillna(metrics_df['Vid'].astype('string'))
+        metrics_df = metrics_df.assign(**{'Vendor Name': vendor_names.astype('category')})
         
-        # Calculate metrics (using metrics_df, unaffected by Channel Type filter)
-        total_revenue = c2b_metrics['Amount'].sum()
-        total_refunds = abs(metrics_df[metrics_df['Channel Type'] == 'REFUND']['Amount'].sum())
+        # Apply both filters for charts and report; the default "all channels" selection keeps every row
+        channel_filter_is_noop = sel_ch == frozenset(channel_types) and not metrics_df['Channel Type'].hasnans
+        filtered_df = metrics_df if channel_filter_is_noop else metrics_df.loc[metrics_df['Channel Type'].isin(sel_ch)]
+        
+        # C2B rows for the vendor breakdown chart (a NumPy mask, no frame copy)
+        is_c2b = (filtered_df['Channel Type'] == 'C2B').to_numpy()
+        
+        # Daily totals, computed once and reused by the avg metric and the charts
+        daily_metrics = daily_totals(metrics_df['Date_only'], metrics_df['Amount'])
+        daily_filtered = daily_metrics if channel_filter_is_noop else daily_totals(filtered_df['Date_only'], filtered_df['Amount'])
+        daily_revenue = daily_filtered.reset_index()
+        daily_revenue['Cumulative'] = np.cumsum(daily_filtered.to_numpy())
+        
+        # Per-channel totals in a single pass (metrics use metrics_df, unaffected by Channel Type filter)
+        by_ch = channel_totals(metrics_df['Channel Type'], metrics_df['Amount'])
+        
+        # Calculate metrics
+        total_revenue = by_ch['amt'].get('C2B', 0.0)
+        total_refunds = abs(by_ch['amt'].get('REFUND', 0.0))
+        total_trans = int(by_ch['n'].get('C2B', 0))
         bank_transfer_charges = 50.0 * len(dfs)  # Fixed per file
         vat_bank_transfer = bank_transfer_charges * 0.16  # 16% VAT
-        nayax_commission = c2b_metrics['Amount'].sum() * 0.01  # 1% of C2B amounts
-        bck_commission = c2b_metrics['Amount'].sum() * 0.005  # 0.5% of C2B amounts
-        ipay_commission = metrics_df['Commission'].sum()  # Ipay Commissions
-        total_vat = metrics_df['Vat'].sum()
+        nayax_commission = total_revenue * 0.01  # 1% of C2B amounts
+        bck_commission = total_revenue * 0.005  # 0.5% of C2B amounts
+        ipay_commission, total_vat = metrics_df[['Commission', 'Vat']].sum()  # Ipay Commissions, VAT
         amount_to_remit = total_revenue - (
             total_refunds + ipay_commission + bank_transfer_charges + 
             vat_bank_transfer + nayax_commission + bck_commission + total_vat
@@ -182,14 +237,12 @@ if uploaded_files:
         with col1:
             st.metric("Total Revenue (KES)", f"{total_revenue:.2f}")
         with col2:
-            if len(metrics_df['Date_only'].unique()) > 0:
-                daily_rev = metrics_df.groupby('Date_only')['Amount'].sum()
-                avg_daily = daily_rev.mean()
+            if len(daily_metrics) > 0:
+                avg_daily = daily_metrics.mean()
                 st.metric("Avg Daily Revenue (KES)", f"{avg_daily:.2f}")
             else:
                 st.metric("Avg Daily Revenue (KES)", "0.00")
         with col3:
-            total_trans = len(c2b_metrics)
             st.metric("Total C2B Transactions", total_trans)
         with col4:
             st.metric("Ipay Commissions (KES)", f"{ipay_commission:.2f}")
@@ -217,19 +270,23 @@ if uploaded_files:
         # Downloadable report (CSV or Excel, affected by both filters)
         st.subheader("📄 Download Financial Report")
         # Prepare report data (using filtered_df for consistency with charts)
-        date_range = f"{filtered_df['Date_only'].min()} to {filtered_df['Date_only'].max()}" if not filtered_df.empty else "N/A"
+        date_range = f"{filtered_df['Date_only'].min().date()} to {filtered_df['Date_only'].max().date()}" if not filtered_df.empty else "N/A"
         uploaded_files_str = ", ".join([file.name for file in uploaded_files])
         filters_applied = f"Channel Types: {', '.join(selected_channels) if selected_channels else 'All'}, Vendor IDs: {', '.join(map(str, selected_vids)) if selected_vids else 'All'}"
         
-        # Recalculate metrics for report to reflect Channel Type filter
-        report_total_revenue = c2b_filtered['Amount'].sum()
-        report_total_refunds = abs(filtered_df[filtered_df['Channel Type'] == 'REFUND']['Amount'].sum())
-        report_bank_transfer_charges = 50.0 * len(dfs) if 'BANKCOST' in filtered_df['Channel Type'].values else 0.0
+        # Recalculate metrics for report to reflect Channel Type filter (reused as-is when the filter is a no-op)
+        if channel_filter_is_noop:
+            report_by_ch = by_ch['amt']
+            report_ipay_commission, report_total_vat = ipay_commission, total_vat
+        else:
+            report_by_ch = channel_totals(filtered_df['Channel Type'], filtered_df['Amount'])['amt']
+            report_ipay_commission, report_total_vat = filtered_df[['Commission', 'Vat']].sum()
+        report_total_revenue = report_by_ch.get('C2B', 0.0)
+        report_total_refunds = abs(report_by_ch.get('REFUND', 0.0))
+        report_bank_transfer_charges = 50.0 * len(dfs) if 'BANKCOST' in report_by_ch.index else 0.0
         report_vat_bank_transfer = report_bank_transfer_charges * 0.16
-        report_nayax_commission = c2b_filtered['Amount'].sum() * 0.01
-        report_bck_commission = c2b_filtered['Amount'].sum() * 0.005
-        report_ipay_commission = filtered_df['Commission'].sum()
-        report_total_vat = filtered_df['Vat'].sum()
+        report_nayax_commission = report_total_revenue * 0.01
+        report_bck_commission = report_total_revenue * 0.005
         report_amount_to_remit = report_total_revenue - (
             report_total_refunds + report_ipay_commission + report_bank_transfer_charges + 
             report_vat_bank_transfer + report_nayax_commission + report_bck_commission + report_total_vat
@@ -273,16 +330,16 @@ if uploaded_files:
         report_format = st.selectbox("Select report format", ["CSV", "Excel"])
         
         if report_format == "CSV":
-            csv = report_df.to_csv(index=False)
+            # Serialized only when the button is clicked
             st.download_button(
                 label="Download Financial Report as CSV",
-                data=csv,
+                data=lambda report_df=report_df: report_df.to_csv(index=False),
                 file_name="sales_financial_report.csv",
                 mime="text/csv"
             )
         else:
             excel_buffer = io.BytesIO()
-            with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
+            with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
                 report_df.to_excel(writer, index=False, sheet_name='Financial Report')
             st.download_button(
                 label="Download Financial Report as Excel",
@@ -294,14 +351,13 @@ if uploaded_files:
         # Cumulative line chart (affected by both filters)
         st.subheader("📈 Cumulative Revenue Over Time")
         if len(filtered_df) > 0:
-            daily_revenue = filtered_df.groupby('Date_only')['Amount'].sum().reset_index()
-            daily_revenue['Date_only'] = pd.to_datetime(daily_revenue['Date_only'])
-            daily_revenue = daily_revenue.sort_values('Date_only')
-            daily_revenue['Cumulative'] = daily_revenue['Amount'].cumsum()
-            
-            fig_cum = px.line(daily_revenue, x='Date_only', y='Cumulative', 
+            # Downsample long date ranges before handing them to Plotly
+            x_days = daily_revenue['Date_only'].to_numpy().astype('int64')
+            cum_chart = daily_revenue.iloc[lttb_indices(x_days, daily_revenue['Cumulative'].to_numpy(), MAX_CHART_POINTS)]
+            fig_cum = px.line(cum_chart, x='Date_only', y='Cumulative', 
                             title="Cumulative Revenue Trend",
-                            markers=True)
+                            markers=True,
+                            render_mode='webgl')
             fig_cum.update_layout(
                 xaxis_title="Date",
                 yaxis_title="Cumulative Revenue (KES)",
@@ -321,7 +377,12 @@ if uploaded_files:
         with col_a:
             # Daily Revenue Bar
             if len(daily_revenue) > 0:
-                fig_daily = px.bar(daily_revenue, x='Date_only', y='Amount',
+                daily_chart = daily_revenue
+                if len(daily_filtered) > MAX_CHART_POINTS:
+                    # Bars must stay true totals, so long ranges are summed into weekly bins rather than sampled
+                    st.caption(f"Showing weekly totals: the range spans more than {MAX_CHART_POINTS} days.")
+                    daily_chart = daily_filtered.resample('W').sum().reset_index()
+                fig_daily = px.bar(daily_chart, x='Date_only', y='Amount',
                                 title="Daily Revenue",
                                 color='Amount',
                                 color_continuous_scale='Blues')
@@ -337,8 +398,17 @@ if uploaded_files:
         
         with col_b:
             # Vendor Breakdown Pie
-            if 'Vendor Name' in filtered_df.columns and len(c2b_filtered) > 0:
-                vendor_rev = c2b_filtered.groupby('Vendor Name')['Amount'].sum().reset_index()
+            if 'Vendor Name' in filtered_df.columns and is_c2b.any():
+                vendor_rev = (
+                    filtered_df['Amount'][is_c2b]
+                    .groupby(filtered_df['Vendor Name'][is_c2b], observed=True).sum()
+                    .sort_values(ascending=False)
+                )
+                if len(vendor_rev) > PIE_TOP_VENDORS:
+                    st.caption(f"Showing the top {PIE_TOP_VENDORS} of {len(vendor_rev)} vendors; the rest are grouped as Other.")
+                    other = vendor_rev.iloc[PIE_TOP_VENDORS:].sum()
+                    vendor_rev = pd.concat([vendor_rev.head(PIE_TOP_VENDORS), pd.Series({'Other': other})])
+                vendor_rev = vendor_rev.rename_axis('Vendor Name').reset_index(name='Amount')
                 fig_pie = px.pie(vendor_rev, values='Amount', names='Vendor Name',
                                 title="Revenue by Vendor (C2B Only)",
                                 color_discrete_sequence=px.colors.qualitative.Pastel)
@@ -355,10 +425,10 @@ if uploaded_files:
             st.dataframe(filtered_df, use_container_width=True)
             
             # Download filtered data as CSV
-            csv = filtered_df.to_csv(index=False)
+            # Serialized only when the button is clicked
             st.download_button(
                 label="Download Filtered Data as CSV",
-                data=csv,
+                data=lambda filtered_df=filtered_df: filtered_df.to_csv(index=False),
                 file_name="filtered_sales_data.csv",
                 mime="text/csv"
             )
@@ -378,4 +448,4 @@ else:
 
 # Footer
 st.markdown("---")
-st.markdown("*Built with Streamlit & Plotly | Powered by pandas & openpyxl*")
\ No newline at end of file
+st.markdown("*Built with Streamlit & Plotly | Powered by pandas & XlsxWriter*")
\ No newline at end of file